@@ -23,8 +23,7 @@ import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from common.messages import DELIM
-from common.messages import DroneReport
+from common.messages import DroneReport, FrameReader
 import logging
 
 
@@ -66,32 +65,28 @@ class Receiver(threading.Thread):
             conn, addr = srv.accept()
             logging.info(f"Drone connected from {addr} to Central GUI Receiver")
             with conn:
-                buf = b""
-                for chunk in iter(lambda: conn.recv(1024), b""):
-                    buf += chunk
-                    while DELIM.encode() in buf:
-                        raw, buf = buf.split(DELIM.encode(), 1)
-                        if not raw:
-                            continue
-                        try:
-                            report = DroneReport(**json.loads(raw.decode()))
-                            log_message = (
-                                f"{time.strftime('%H:%M:%S')} | "
-                                f"Drone: {report.drone_id}, Status: {report.status}, Batt: {report.battery_level}%, "
-                                f"AvgTemp: {report.avg_temperature:.1f}°C, AvgHum: {report.avg_humidity:.0f}%, "
-                                f"Sensors: {report.sensor_count}, Anomalies: {len(report.anomalies)}\\n"
-                            )
-                            if report.anomalies:
-                                for anomaly in report.anomalies:
-                                    log_message += (
-                                        f"  └─ Anomaly: Sensor {anomaly.get('sensor_id', 'N/A')}, "
-                                        f"Val: {anomaly.get('val', 'N/A')}, TS: {anomaly.get('ts', 'N/A')}\\n"
-                                    )
-                            self.gui_q.put(log_message)
-                        except json.JSONDecodeError:
-                            logging.error(f"Central GUI Receiver: Failed to decode JSON: {raw.decode()}")
-                        except Exception as e:
-                            logging.error(f"Central GUI Receiver: Error processing report: {e}")
+                for raw in FrameReader(conn):
+                    if not raw:
+                        continue
+                    try:
+                        report = DroneReport.from_bytes(raw)
+                        log_message = (
+                            f"{time.strftime('%H:%M:%S')} | "
+                            f"Drone: {report.drone_id}, Status: {report.status}, Batt: {report.battery_level}%, "
+                            f"AvgTemp: {report.avg_temperature:.1f}°C, AvgHum: {report.avg_humidity:.0f}%, "
+                            f"Sensors: {report.sensor_count}, Anomalies: {len(report.anomalies)}\\n"
+                        )
+                        if report.anomalies:
+                            for anomaly in report.anomalies:
+                                log_message += (
+                                    f"  └─ Anomaly: Sensor {anomaly.get('sensor_id', 'N/A')}, "
+                                    f"Val: {anomaly.get('val', 'N/A')}, TS: {anomaly.get('ts', 'N/A')}\\n"
+                                )
+                        self.gui_q.put(log_message)
+                    except json.JSONDecodeError:
+                        logging.error(f"Central GUI Receiver: Failed to decode JSON: {raw!r}")
+                    except Exception as e:
+                        logging.error(f"Central GUI Receiver: Error processing report: {e}")
             logging.info(f"Drone from {addr} disconnected from Central GUI Receiver")
 
 
@@ -16,11 +16,11 @@ import socket
 import sys
 import argparse
 from pathlib import Path
-from common.messages import DELIM, DroneReport
 
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent))
 import logconf  # noqa: F401
+from common.messages import DroneReport, FrameReader
 
 
 def main(host: str = "0.0.0.0", port: int = 6000):
@@ -40,28 +40,24 @@ def main(host: str = "0.0.0.0", port: int = 6000):
     while True:
         conn, addr = srv.accept()
         logging.info("Drone connected from %s:%s", *addr)
-        buffer = b""
         with conn:
-            for chunk in iter(lambda: conn.recv(1024), b""):
-                buffer += chunk
-                while DELIM.encode() in buffer:
-                    raw, buffer = buffer.split(DELIM.encode(), 1)
-                    if not raw:
-                        continue
-                    batch = DroneReport(**json.loads(raw.decode()))
-                    logging.info(
-                        "Report Received: AvgT %.1f, AvgH %.1f, Batt %d%%, Status %s, Sensors %d, Anom %d",
-                        batch.avg_temperature,
-                        batch.avg_humidity,
-                        batch.battery_level,
-                        batch.status,
-                        batch.sensor_count,
-                        len(batch.anomalies)
-                    )
-                    if hasattr(self, 'gui_q'):
-                        self.gui_q.put(batch)
-                    else:
-                        pass
+            for raw in FrameReader(conn):
+                if not raw:
+                    continue
+                try:
+                    batch = DroneReport.from_bytes(raw)
+                except json.JSONDecodeError:
+                    logging.error("Failed to decode JSON: %r", raw)
+                    continue
+                logging.info(
+                    "Report Received: AvgT %.1f, AvgH %.1f, Batt %d%%, Status %s, Sensors %d, Anom %d",
+                    batch.avg_temperature,
+                    batch.avg_humidity,
+                    batch.battery_level,
+                    batch.status,
+                    batch.sensor_count,
+                    len(batch.anomalies)
+                )
 
 
 if __name__ == "__main__":
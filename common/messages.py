@@ -5,6 +5,10 @@
 
 Sensor Node -> (SensorReading) -> Drone Edge -> (DroneReport) -> Central Server
 
+framing:
+    SensorReading: one JSON document per line (DELIM)
+    DroneReport:   4-byte big-endian payload length followed by the JSON payload
+
 format:
     SensorReading:
     {
@@ -35,8 +39,67 @@ format:
 from dataclasses import dataclass, asdict, field
 from datetime import datetime, timezone
 import json
+import struct
+
+try:
+    import orjson  # optional, parses/serialises bytes directly
+except ImportError:
+    orjson = None
 
 DELIM = "\n" 
+DELIM_B = DELIM.encode()
+FRAME_HEADER = struct.Struct(">I")  # payload length of a DroneReport frame
+
+if orjson is not None:
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+else:
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+    json_loads = json.loads  # accepts bytes as well
+
+
+class FrameReader:
+    """
+    reads length-prefixed frames from a socket through one reusable buffer
+    a single recv_into often pulls in several frames; complete frames are
+    handed out and the partial tail is moved to the front of the buffer
+    """
+
+    def __init__(self, conn, size: int = 65536):
+        self.conn = conn
+        self.size = size
+
+    def __iter__(self):
+        """
+        yields the payload of each frame until the peer closes the connection
+        """
+        header_size = FRAME_HEADER.size
+        unpack_from = FRAME_HEADER.unpack_from
+        buf = bytearray(self.size)
+        view = memoryview(buf)
+        wpos = 0
+        while True:
+            if wpos == len(buf):  # a single frame is larger than the buffer
+                grown = bytearray(2 * len(buf))
+                grown[:wpos] = buf
+                buf, view = grown, memoryview(grown)
+            n = self.conn.recv_into(view[wpos:])
+            if not n:
+                return
+            wpos += n
+            rpos = 0
+            while wpos - rpos >= header_size:
+                (length,) = unpack_from(buf, rpos)
+                end = rpos + header_size + length
+                if end > wpos:
+                    break
+                yield bytes(view[rpos + header_size:end])
+                rpos = end
+            if rpos:
+                view[:wpos - rpos] = view[rpos:wpos]
+                wpos -= rpos
 
 
 @dataclass
@@ -52,7 +115,7 @@ class SensorReading:
         """
         serializes the reading to JSON and encodes as bytes for network transmission
         """
-        return (json.dumps(asdict(self)) + DELIM).encode()
+        return json_dumps(asdict(self)) + DELIM_B
 
     @staticmethod
     def from_bytes(raw: bytes) -> "SensorReading":
@@ -82,4 +145,20 @@ class DroneReport:
         """
         serializes the report to JSON and encodes as bytes for network transmission
         """
-        return (json.dumps(asdict(self)) + DELIM).encode()
\ No newline at end of file
+        return json_dumps(asdict(self)) + DELIM_B
+
+    def to_frame(self) -> bytes:
+        """
+        serializes the report to JSON behind a length header
+        the receiver reads exactly header + payload, no delimiter scan needed
+        """
+        body = json_dumps(asdict(self))
+        return FRAME_HEADER.pack(len(body)) + body
+
+    @staticmethod
+    def from_bytes(raw: bytes) -> "DroneReport":
+        """
+        creates a DroneReport instance from received bytes
+        raw: JSON-encoded report received from network
+        """
+        return DroneReport(**json_loads(raw))
\ No newline at end of file
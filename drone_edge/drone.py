@@ -285,11 +285,11 @@ class DroneEdge:
 
         try:
             with socket.create_connection(self.central_addr, timeout=2) as sock:
-                sock.sendall(rpt.to_bytes())
+                sock.sendall(rpt.to_frame())
             logging.info(f"Report sent to {self.central_addr}: status {rpt.status}, {len(valid_readings)} readings, {len(anomalies_list)} anomalies.")
         except OSError as exc:
             logging.warning(f"Central server {self.central_addr} unreachable ({exc}) – saving report to disk.")
-            report_bytes = rpt.to_bytes()
+            report_bytes = rpt.to_frame()
             (self.unsent_dir / f"{time.time()}.json").write_bytes(report_bytes)
         except Exception as e_general:
             logging.error(f"An unexpected error occurred in _send_report: {e_general}")
@@ -306,7 +306,7 @@ class DroneEdge:
                 logging.info(f"Attempting to resend {report_file.name}")
                 try:
                     report_bytes = report_file.read_bytes()
-                    # for simplicity, i assume the file contains exactly what to_bytes() produced
+                    # for simplicity, i assume the file contains exactly what to_frame() produced
                     # report_data = json.loads(report_bytes.decode().rstrip(DELIM)) # if DELIM was an issue
                     # rpt_obj = DroneReport(**report_data) # this would re-validate if needed
 